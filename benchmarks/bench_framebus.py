@@ -0,0 +1,79 @@
+"""
+Benchmark FrameBus with a synthetic producer and several consumer processes.
+
+Reports the producer's publish cost per frame and each consumer's median
+latency from publish to acquire, at 1080p and 4K.
+
+    python benchmarks/bench_framebus.py --consumers 3 --frames 200
+"""
+import argparse
+import multiprocessing as mp
+import statistics
+import time
+
+import numpy as np
+
+from pyautoos.framebus import FrameBus, FrameBusReader
+
+RESOLUTIONS = {"1080p": (1920, 1080), "4K": (3840, 2160)}
+
+
+def consume(name: str, index: int, frames: int, results: "mp.Queue") -> None:
+    reader = FrameBusReader(name, index)
+    latencies, torn, last = [], 0, 0
+    while len(latencies) < frames:
+        frame = reader.acquire(after=last, timeout=5)
+        if frame is None:
+            break
+        latencies.append(time.time() - frame.timestamp)
+        # Every synthetic frame is a single color; a mixed frame means a torn read.
+        if frame.array[0, 0, 0] != frame.array[-1, -1, 0]:
+            torn += 1
+        last = frame.seq
+        frame.release()
+    reader.close()
+    results.put((index, len(latencies), torn, statistics.median(latencies) if latencies else None))
+
+
+def run(label: str, width: int, height: int, consumers: int, frames: int, interval: float) -> None:
+    palette = [np.full((height, width, 3), i, dtype=np.uint8) for i in range(8)]
+    with FrameBus(width, height, slots=consumers + 2, max_consumers=consumers) as bus:
+        results: "mp.Queue" = mp.Queue()
+        procs = [mp.Process(target=consume, args=(bus.name, i, frames, results))
+                 for i in range(consumers)]
+        for p in procs:
+            p.start()
+        time.sleep(0.5)
+        publish_times = []
+        n = 0
+        while any(p.is_alive() for p in procs):
+            t = time.perf_counter()
+            bus.publish(palette[n % len(palette)])
+            publish_times.append(time.perf_counter() - t)
+            n += 1
+            time.sleep(interval)
+        reports = sorted(results.get() for _ in procs)
+        for p in procs:
+            p.join()
+    print(f"{label}: publish {statistics.median(publish_times) * 1e3:.2f} ms/frame "
+          f"({n} frames published)")
+    for index, received, torn, latency in reports:
+        latency_ms = "n/a" if latency is None else f"{latency * 1e3:.2f} ms"
+        print(f"  consumer {index}: {received} frames, {torn} torn, median latency {latency_ms}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--consumers", type=int, default=3)
+    parser.add_argument("--frames", type=int, default=200, help="frames each consumer reads")
+    parser.add_argument("--interval", type=float, default=0.005,
+                        help="seconds between published frames")
+    parser.add_argument("--resolution", choices=sorted(RESOLUTIONS), action="append")
+    args = parser.parse_args()
+    for label in args.resolution or list(RESOLUTIONS):
+        width, height = RESOLUTIONS[label]
+        run(label, width, height, args.consumers, args.frames, args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark Web.watch_dir against polling Web.list_dir in a large directory.
+
+Creates a directory with many entries, then drops a few new files into it and
+reports each watcher's median latency from file creation to event and its CPU
+use while idle-waiting, for inotify, the scandir snapshot fallback and a plain
+list_dir polling loop.
+
+    python benchmarks/bench_watch_dir.py --entries 20000 --files 5 --interval 0.5
+"""
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+
+import pyautoos.web as web
+from pyautoos.web import Web
+
+
+def _no_inotify(*args, **kwargs):
+    raise AttributeError("inotify disabled for benchmark")
+
+
+def list_dir_poll(path: str, interval: float):
+    known = set(Web.list_dir(path))
+    while True:
+        time.sleep(interval)
+        current = set(Web.list_dir(path))
+        for name in current - known:
+            yield {"type": "created", "path": os.path.join(path, name)}
+        known = current
+
+
+def run(label: str, path: str, events, files: int, spacing: float) -> None:
+    stamps = []
+
+    def create():
+        for i in range(files):
+            time.sleep(spacing)
+            stamps.append(time.monotonic())
+            open(os.path.join(path, f"new_{label}_{i}.in"), "w").close()
+
+    thread = threading.Thread(target=create)
+    cpu, wall = time.process_time(), time.monotonic()
+    thread.start()
+    latencies = []
+    for _ in events:
+        latencies.append(time.monotonic() - stamps[-1])
+        if len(latencies) == files:
+            break
+    events.close()
+    thread.join()
+    cpu, wall = time.process_time() - cpu, time.monotonic() - wall
+    print(f"{label}: median latency {statistics.median(latencies) * 1e3:.0f} ms, "
+          f"CPU {cpu / wall * 100:.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=20000, help="existing files in the directory")
+    parser.add_argument("--files", type=int, default=5, help="new files to create and wait for")
+    parser.add_argument("--interval", type=float, default=0.5,
+                        help="poll interval for the snapshot fallback and list_dir loop")
+    parser.add_argument("--spacing", type=float, default=0.7, help="seconds between new files")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    root = tempfile.mkdtemp(prefix="bench_watch_dir_")
+    try:
+        for i in range(args.entries):
+            open(os.path.join(root, f"f{i}"), "w").close()
+        run("inotify", root, Web.watch_dir(root, patterns=["*.in"], debounce=0.02),
+            args.files, args.spacing)
+        original = web._InotifySource
+        web._InotifySource = _no_inotify
+        try:
+            run("snapshot", root, Web.watch_dir(root, patterns=["*.in"], debounce=0.02,
+                                                poll_interval=args.interval),
+                args.files, args.spacing)
+        finally:
+            web._InotifySource = original
+        run("list_dir poll", root, list_dir_poll(root, args.interval), args.files, args.spacing)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
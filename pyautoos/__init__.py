@@ -11,6 +11,8 @@ from .window import Window
 from .screen import Screen
 from .web import Web
 from .utils import Utils
+from .recorder import SessionRecorder, SessionReader
+from .framebus import FrameBus, FrameBusReader
 
 __version__ = "0.1.0"
 
@@ -2,7 +2,13 @@ import subprocess
 import psutil
 import logging
 import os
-from typing import Optional, List, Dict
+import platform
+import re
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Union
 
 logger = logging.getLogger("pyautoos.app")
 
@@ -27,6 +33,180 @@ class App:
             logger.error(f"Failed to open app {path}: {e}")
             raise
 
+    @staticmethod
+    def launch_many(specs: List[Union[str, Dict]], timeout: float = 30.0,
+                    poll_interval: float = 0.05) -> List[Dict]:
+        """
+        Launch several apps concurrently and wait until each one is ready.
+
+        Each spec is a path or a dict with keys:
+            path     executable or script to start (required)
+            args     extra command-line arguments
+            name     process name used to skip apps that are already running; by
+                     default a process whose command line ends with the basename
+                     of path and args counts as already running
+            timeout  per-app readiness timeout in seconds
+            ready    readiness probes, all of which must pass:
+                       {'process': 0.5}         alive for at least 0.5s
+                       {'window': 'Notepad'}    a window title contains the text (Windows)
+                       {'port': 8080}           TCP port accepts connections (or (host, port))
+                       {'file': '/tmp/ready'}   the file exists
+                       {'stdout': r'listening'} a stdout line matches the regex
+
+        A process that exits is only ready if it exited with code 0, all probes
+        pass and no 'process' probe was given. Already-running apps skip the
+        'process' and 'stdout' probes but still wait on the others.
+
+        Specs with the same path and args are launched once; they must then also
+        agree on 'ready', 'timeout' and 'name', or ValueError is raised. Returns one dict per
+        spec with 'path', 'pid', 'process', 'ready', 'already_running',
+        'time_to_ready' (seconds, None if not ready) and 'error'.
+        """
+        specs = [{'path': s} if isinstance(s, str) else dict(s) for s in specs]
+        keys = [(s['path'], tuple(s.get('args', ()))) for s in specs]
+        unique = list(dict.fromkeys(keys))
+        for spec, key in zip(specs, keys):
+            first = specs[keys.index(key)]
+            for option in ('ready', 'timeout', 'name'):
+                if spec.get(option) != first.get(option):
+                    raise ValueError(f"Duplicate specs for {spec['path']} differ in '{option}'")
+        with ThreadPoolExecutor(max_workers=max(1, len(unique))) as pool:
+            futures = {k: pool.submit(App._launch_and_wait, specs[keys.index(k)],
+                                      timeout, poll_interval) for k in unique}
+            launched = {k: f.result() for k, f in futures.items()}
+        return [dict(launched[k]) for k in keys]
+
+    @staticmethod
+    def _find_running(name: str) -> Optional[psutil.Process]:
+        """Return the first running process whose name contains name."""
+        for proc in psutil.process_iter(['name']):
+            if proc.info['name'] and name.lower() in proc.info['name'].lower():
+                return proc
+        return None
+
+    @staticmethod
+    def _find_launched(path: str, args: List[str]) -> Optional[psutil.Process]:
+        """
+        Return a running process started as path with args.
+
+        The command line must end with the basename of path followed by args, so
+        interpreted scripts ('sh run.sh') match too, while another process of the
+        same interpreter with different arguments does not.
+        """
+        base = os.path.basename(path).lower()
+        n = len(args) + 1
+        for proc in psutil.process_iter(['cmdline']):
+            cmdline = proc.info['cmdline'] or []
+            if proc.pid == os.getpid() or len(cmdline) < n:
+                continue
+            tail = cmdline[-n:]
+            if os.path.basename(tail[0]).lower() == base and tail[1:] == list(args):
+                return proc
+        return None
+
+    @staticmethod
+    def _launch_and_wait(spec: Dict, timeout: float, poll_interval: float) -> Dict:
+        """Launch a single app spec and poll its readiness probes."""
+        path = spec['path']
+        args = [str(a) for a in spec.get('args', [])]
+        probes = spec.get('ready') or {'process': 0}
+        timeout = spec.get('timeout', timeout)
+        result = {'path': path, 'pid': None, 'process': None, 'ready': False,
+                  'already_running': False, 'time_to_ready': None, 'error': None}
+        if 'window' in probes and platform.system() != "Windows":
+            result['error'] = "window probe requires Windows"
+            logger.error(f"App {path} failed readiness check: {result['error']}")
+            return result
+
+        start = time.monotonic()
+        existing = App._find_running(spec['name']) if spec.get('name') else App._find_launched(path, args)
+        if existing is not None:
+            result.update(pid=existing.pid, already_running=True)
+            logger.info(f"App already running, not launching: {path} (pid {existing.pid})")
+            # The process probe is satisfied by the running process; the others still apply.
+            probes = {k: v for k, v in probes.items() if k not in ('process', 'stdout')}
+            return App._wait_ready(result, None, probes, start, timeout, poll_interval, None)
+
+        stdout_match = threading.Event()
+        try:
+            ext = os.path.splitext(path)[1].lower()
+            if platform.system() == "Windows" and ext != '.exe' and not args \
+                    and 'stdout' not in probes:
+                os.startfile(path)
+                proc = None
+            else:
+                proc = subprocess.Popen(
+                    [path] + args,
+                    stdout=subprocess.PIPE if 'stdout' in probes else None,
+                    text='stdout' in probes)
+                result.update(pid=proc.pid, process=proc)
+        except Exception as e:
+            logger.error(f"Failed to launch app {path}: {e}")
+            result['error'] = str(e)
+            return result
+
+        reader = None
+        if proc is not None and 'stdout' in probes:
+            pattern = re.compile(probes['stdout'])
+            def read_stdout():
+                # Keep draining after the match so the child never blocks on a full pipe.
+                for line in proc.stdout:
+                    if not stdout_match.is_set() and pattern.search(line):
+                        stdout_match.set()
+            reader = threading.Thread(target=read_stdout, daemon=True)
+            reader.start()
+        return App._wait_ready(result, proc, probes, start, timeout, poll_interval,
+                               stdout_match, reader)
+
+    @staticmethod
+    def _wait_ready(result: Dict, proc: Optional[subprocess.Popen], probes: Dict, start: float,
+                    timeout: float, poll_interval: float, stdout_match: Optional[threading.Event],
+                    reader: Optional[threading.Thread] = None) -> Dict:
+        """Poll probes until they all pass, the process exits, or timeout expires."""
+        path = result['path']
+        deadline = start + timeout
+        while True:
+            exited = proc is not None and proc.poll() is not None
+            if exited and reader is not None:
+                # Let the reader see the last lines the process printed before exiting.
+                reader.join(timeout=1.0)
+            now = time.monotonic()
+            passed = App._probes_pass(probes, now - start, stdout_match)
+            if exited and ('process' in probes or proc.returncode != 0 or not passed):
+                result['error'] = f"exited with code {proc.returncode} before becoming ready"
+                break
+            if passed:
+                result.update(ready=True, time_to_ready=now - start)
+                logger.info(f"App ready: {path} in {now - start:.2f}s")
+                return result
+            if now >= deadline:
+                result['error'] = f"not ready after {timeout}s"
+                break
+            time.sleep(poll_interval)
+        logger.error(f"App {path} failed readiness check: {result['error']}")
+        return result
+
+    @staticmethod
+    def _probes_pass(probes: Dict, elapsed: float, stdout_match: Optional[threading.Event]) -> bool:
+        """Check whether every readiness probe in probes currently passes."""
+        if 'process' in probes and elapsed < probes['process']:
+            return False
+        if 'file' in probes and not os.path.exists(probes['file']):
+            return False
+        if 'stdout' in probes and not stdout_match.is_set():
+            return False
+        if 'port' in probes:
+            port = probes['port']
+            host, port = port if isinstance(port, (tuple, list)) else ('127.0.0.1', port)
+            try:
+                with socket.create_connection((host, port), timeout=0.2):
+                    pass
+            except OSError:
+                return False
+        if 'window' in probes and not App.get_app_windows(probes['window']):
+            return False
+        return True
+
     @staticmethod
     def close_app(name: str) -> bool:
         """Close all processes matching the app name."""
@@ -41,13 +221,91 @@ class App:
                     logger.error(f"Failed to close app {proc.info['name']}: {e}")
         return closed
 
+    @staticmethod
+    def close_many(names_or_pids: List[Union[str, int]], grace: float = 5.0,
+                   include_children: bool = False, kill_timeout: float = 2.0) -> List[Dict]:
+        """
+        Terminate every matching process at once, then kill those still alive after grace seconds.
+
+        Strings match process names as in close_app, ints are pids. With
+        include_children the whole child tree of each match is signalled too.
+        Returns one dict per process with 'pid', 'name', 'outcome'
+        ('terminated', 'killed', 'gone' or 'failed'), 'returncode' and
+        'elapsed' (seconds from the first signal until exit).
+        """
+        procs: Dict[int, psutil.Process] = {}
+        for target in names_or_pids:
+            if isinstance(target, int):
+                try:
+                    matches = [psutil.Process(target)]
+                except psutil.NoSuchProcess:
+                    logger.info(f"Process {target} is not running")
+                    continue
+            else:
+                matches = [p for p in psutil.process_iter(['name'])
+                           if p.info['name'] and target.lower() in p.info['name'].lower()]
+            for proc in matches:
+                procs[proc.pid] = proc
+                if include_children:
+                    try:
+                        for child in proc.children(recursive=True):
+                            procs[child.pid] = child
+                    except psutil.Error:
+                        pass
+        # Never signal the caller, whether it matched directly or as a child of a match.
+        procs.pop(os.getpid(), None)
+
+        reports: Dict[int, Dict] = {}
+        for pid, proc in procs.items():
+            try:
+                name = proc.name()
+            except psutil.Error:
+                name = None
+            reports[pid] = {'pid': pid, 'name': name, 'outcome': None,
+                            'returncode': None, 'elapsed': None}
+
+        start = time.monotonic()
+        signalled = []
+        for pid, proc in procs.items():
+            try:
+                proc.terminate()
+                signalled.append(proc)
+            except psutil.NoSuchProcess:
+                reports[pid].update(outcome='gone', elapsed=0.0)
+            except psutil.Error as e:
+                logger.error(f"Failed to terminate process {pid}: {e}")
+                reports[pid]['outcome'] = 'failed'
+
+        def on_exit(outcome):
+            def record(proc):
+                reports[proc.pid].update(outcome=outcome, returncode=proc.returncode,
+                                         elapsed=time.monotonic() - start)
+            return record
+
+        _, alive = psutil.wait_procs(signalled, timeout=grace, callback=on_exit('terminated'))
+        if alive:
+            for proc in alive:
+                try:
+                    proc.kill()
+                except psutil.NoSuchProcess:
+                    pass
+                except psutil.Error as e:
+                    logger.error(f"Failed to kill process {proc.pid}: {e}")
+            _, alive = psutil.wait_procs(alive, timeout=kill_timeout, callback=on_exit('killed'))
+            for proc in alive:
+                reports[proc.pid]['outcome'] = 'failed'
+                logger.error(f"Process {proc.pid} still alive after kill")
+
+        counts = {}
+        for report in reports.values():
+            counts[report['outcome']] = counts.get(report['outcome'], 0) + 1
+        logger.info(f"Closed {len(reports)} processes in {time.monotonic() - start:.2f}s: {counts}")
+        return list(reports.values())
+
     @staticmethod
     def is_app_running(name: str) -> bool:
         """Check if an app is running by name."""
-        for proc in psutil.process_iter(['name']):
-            if proc.info['name'] and name.lower() in proc.info['name'].lower():
-                return True
-        return False
+        return App._find_running(name) is not None
 
     @staticmethod
     def get_active_app() -> Optional[str]:
@@ -0,0 +1,301 @@
+import logging
+import struct
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger("pyautoos.framebus")
+
+# Shared memory layout:
+#   header:  MAGIC, slot count, consumer count, width, height
+#   latest:  uint64 sequence number of the newest complete frame
+#   pins:    one uint64 per consumer, the sequence it currently holds (0 = none)
+#   slots:   per slot (uint64 sequence, float64 timestamp), 0 while being written
+#   data:    one HxWx3 uint8 frame per slot, 64-byte aligned
+# Each pin has a single writer (its consumer) and each slot header has a single
+# writer (the producer), so no cross-process lock is needed. Handing a slot over
+# is a Dekker-style handshake: the producer zeroes a slot's sequence and then
+# reads the pins, while a consumer writes its pin and then reads the sequence.
+# That needs each store ordered before the following load, which x86 and ARM do
+# not guarantee on their own, so both sides issue _fence() in between.
+MAGIC = b"PAOSBUS1"
+_HEADER = struct.Struct("<8sIIII")
+_ALIGN = 64
+
+
+def _layout(slots: int, consumers: int, width: int, height: int):
+    latest = _HEADER.size + (-_HEADER.size % 8)
+    pins = latest + 8
+    slot_meta = pins + 8 * consumers
+    data = slot_meta + 16 * slots
+    data += -data % _ALIGN
+    frame_size = width * height * 3
+    slot_size = frame_size + (-frame_size % _ALIGN)
+    return latest, pins, slot_meta, data, slot_size, data + slot_size * slots
+
+
+_FENCE_LOCK = threading.Lock()
+
+
+def _fence() -> None:
+    """Full memory barrier: acquiring a lock is an atomic read-modify-write on every platform."""
+    with _FENCE_LOCK:
+        pass
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without letting this process unlink it on exit."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always registers the segment with the resource tracker,
+        # which would unlink it when this consumer exits.
+        from multiprocessing import resource_tracker
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args, **kwargs: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+class _Segment:
+    """NumPy views over the fields of a frame bus segment."""
+    def __init__(self, shm: shared_memory.SharedMemory):
+        import numpy as np
+        magic, slots, consumers, width, height = _HEADER.unpack_from(shm.buf, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Shared memory {shm.name} is not a pyautoos frame bus")
+        self.shm = shm
+        self.slots, self.consumers = slots, consumers
+        self.width, self.height = width, height
+        latest, pins, slot_meta, data, slot_size, _ = _layout(slots, consumers, width, height)
+        self.latest = np.ndarray((1,), dtype=np.uint64, buffer=shm.buf, offset=latest)
+        self.pins = np.ndarray((consumers,), dtype=np.uint64, buffer=shm.buf, offset=pins)
+        self.seqs = np.ndarray((slots,), dtype=np.uint64, buffer=shm.buf,
+                               offset=slot_meta, strides=(16,))
+        self.stamps = np.ndarray((slots,), dtype=np.float64, buffer=shm.buf,
+                                 offset=slot_meta + 8, strides=(16,))
+        self.frames = np.ndarray((slots, height, width, 3), dtype=np.uint8, buffer=shm.buf,
+                                 offset=data, strides=(slot_size, width * 3, 3, 1))
+
+    def release(self) -> None:
+        self.latest = self.pins = self.seqs = self.stamps = self.frames = None
+
+
+class FrameBus:
+    """
+    Single-producer frame ring in shared memory for cross-process capture consumers.
+
+    The producer copies each frame into a free slot once; any number of
+    FrameBusReader processes map the same slots as read-only NumPy views, so
+    the screen is captured once per cycle regardless of consumer count. Slots
+    pinned by a consumer and the newest frame are never overwritten, so
+    ``slots`` should be at least ``max_consumers + 2``.
+    """
+    def __init__(self, width: int, height: int, slots: int = 6, max_consumers: int = 4,
+                 name: Optional[str] = None):
+        if slots < max_consumers + 2:
+            raise ValueError(f"A frame bus with {max_consumers} consumers needs at least "
+                             f"{max_consumers + 2} slots, got {slots}")
+        size = _layout(slots, max_consumers, width, height)[-1]
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _HEADER.pack_into(self._shm.buf, 0, MAGIC, slots, max_consumers, width, height)
+        self._seg = _Segment(self._shm)
+        self._seg.latest[0] = 0
+        self._seg.pins[:] = 0
+        self._seg.seqs[:] = 0
+        self._next_slot = 0
+        self._seq = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.frames_published = 0
+        logger.info(f"Created frame bus {self.name} ({width}x{height}, {slots} slots, {size} bytes)")
+
+    @property
+    def name(self) -> str:
+        """Shared memory name that readers attach to."""
+        return self._shm.name
+
+    def _free_slot(self) -> int:
+        seg = self._seg
+        latest = int(seg.latest[0])
+        for i in range(seg.slots):
+            slot = (self._next_slot + i) % seg.slots
+            seq = int(seg.seqs[slot])
+            if seq != 0 and (seq == latest or seq in seg.pins):
+                continue
+            # Invalidate first, then re-check pins: a reader that pinned this slot
+            # in the meantime will see the zeroed sequence and back off.
+            seg.seqs[slot] = 0
+            _fence()
+            if seq != 0 and seq in seg.pins:
+                seg.seqs[slot] = seq
+                continue
+            self._next_slot = slot + 1
+            return slot
+        raise RuntimeError("All frame bus slots are pinned by consumers")
+
+    def publish(self, frame: Any, timestamp: Optional[float] = None) -> int:
+        """Copy a frame (PIL image or HxWx3 uint8 array) into the ring. Returns its sequence number."""
+        import numpy as np
+        if hasattr(frame, "convert"):
+            frame = frame.convert("RGB")
+        arr = np.asarray(frame, dtype=np.uint8)
+        seg = self._seg
+        if arr.shape != (seg.height, seg.width, 3):
+            raise ValueError(f"Frame shape {arr.shape} does not match bus "
+                             f"({seg.height}, {seg.width}, 3)")
+        slot = self._free_slot()
+        seg.frames[slot] = arr
+        self._seq += 1
+        seg.stamps[slot] = time.time() if timestamp is None else timestamp
+        seg.seqs[slot] = self._seq
+        seg.latest[0] = self._seq
+        self.frames_published += 1
+        return self._seq
+
+    def start_capture(self, fps: float = 10.0,
+                      source: Optional[Callable[[], Any]] = None) -> 'FrameBus':
+        """Capture and publish frames at fps on a background thread (screen by default)."""
+        if source is None:
+            def source():
+                import pyautogui
+                return pyautogui.screenshot()
+        interval = 1.0 / fps
+
+        def loop():
+            next_tick = time.monotonic()
+            while not self._stop.is_set():
+                try:
+                    self.publish(source())
+                except Exception as e:
+                    logger.error(f"Failed to publish frame: {e}")
+                next_tick = max(next_tick + interval, time.monotonic())
+                self._stop.wait(next_tick - time.monotonic())
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=loop, name="pyautoos-framebus", daemon=True)
+        self._thread.start()
+        logger.info(f"Frame bus {self.name} capturing at {fps} fps")
+        return self
+
+    def stop_capture(self) -> None:
+        """Stop the background capture thread."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def close(self) -> None:
+        """Stop capturing and destroy the shared memory segment."""
+        self.stop_capture()
+        self._seg.release()
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        logger.info(f"Closed frame bus {self.name}")
+
+    def __enter__(self) -> 'FrameBus':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class BusFrame:
+    """A pinned frame from a FrameBusReader. Release it to let the producer reuse the slot."""
+    def __init__(self, reader: 'FrameBusReader', seq: int, timestamp: float, array):
+        self._reader = reader
+        self.seq = seq
+        self.timestamp = timestamp
+        self.array = array
+
+    def release(self) -> None:
+        """Unpin the slot. The array must not be used afterwards."""
+        if self.array is not None:
+            self.array = None
+            self._reader._release(self)
+
+    def __enter__(self) -> 'BusFrame':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+class FrameBusReader:
+    """
+    Consumer side of a FrameBus. Each consumer process uses its own index
+    in range(max_consumers) and holds at most one frame at a time.
+
+    Attaching clears any pin left on the index by a consumer that exited
+    without releasing its frame, so a restarted worker can take over its index.
+    """
+    def __init__(self, name: str, consumer: int):
+        self._held: Optional[BusFrame] = None
+        self._shm = _attach(name)
+        self._seg = _Segment(self._shm)
+        if not 0 <= consumer < self._seg.consumers:
+            self.close()
+            raise ValueError(f"Consumer index {consumer} out of range for bus {name}")
+        self.consumer = consumer
+        self._seg.pins[consumer] = 0
+        self.width, self.height = self._seg.width, self._seg.height
+
+    @property
+    def latest_seq(self) -> int:
+        """Sequence number of the newest published frame (0 before the first)."""
+        return int(self._seg.latest[0])
+
+    def acquire(self, after: int = 0, timeout: Optional[float] = None,
+                poll_interval: float = 0.001) -> Optional[BusFrame]:
+        """
+        Pin and return the newest frame with a sequence number greater than after.
+        Waits up to timeout seconds (forever if None); returns None on timeout.
+        """
+        seg = self._seg
+        if seg.pins is None:
+            raise RuntimeError("Reader is closed")
+        if self._held is not None:
+            raise RuntimeError("Release the previous frame before acquiring another")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            seq = int(seg.latest[0])
+            if seq > after:
+                slot = int((seg.seqs == seq).argmax())
+                seg.pins[self.consumer] = seq
+                _fence()
+                if int(seg.seqs[slot]) == seq:
+                    view = seg.frames[slot]
+                    view.flags.writeable = False
+                    self._held = BusFrame(self, seq, float(seg.stamps[slot]), view)
+                    return self._held
+                seg.pins[self.consumer] = 0
+                continue
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(poll_interval)
+
+    def _release(self, frame: BusFrame) -> None:
+        if self._held is frame:
+            self._held = None
+            self._seg.pins[self.consumer] = 0
+
+    def close(self) -> None:
+        """Detach from the shared memory segment, releasing any frame still held."""
+        if self._held is not None:
+            # Drop the view before unmapping; reading it afterwards would crash.
+            self._held.release()
+        if self._seg.pins is not None:
+            self._seg.release()
+            self._shm.close()
+
+    def __enter__(self) -> 'FrameBusReader':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
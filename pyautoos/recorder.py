@@ -0,0 +1,299 @@
+import bisect
+import logging
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("pyautoos.recorder")
+
+# Container layout: a file header followed by append-only records.
+#   header: MAGIC, tile size
+#   record: kind, timestamp, width, height, payload length, zlib payload
+# Keyframe payloads hold the raw RGB frame. Delta payloads hold a tile count
+# followed by (tile_x, tile_y, tile bytes) for every tile that changed since
+# the previous frame.
+MAGIC = b"PAOSREC1"
+_FILE_HEADER = struct.Struct("<8sH")
+_RECORD_HEADER = struct.Struct("<BdIII")
+_TILE_COUNT = struct.Struct("<I")
+_TILE_POS = struct.Struct("<HH")
+
+KEYFRAME = 1
+DELTA = 2
+
+
+def _to_array(frame: Any):
+    """Convert a PIL image or array-like frame to a contiguous HxWx3 uint8 array the caller owns."""
+    import numpy as np
+    if hasattr(frame, "convert"):
+        arr = np.ascontiguousarray(np.asarray(frame.convert("RGB"), dtype=np.uint8))
+    else:
+        # Sources may reuse one buffer between grabs, so never keep a reference to it.
+        arr = np.array(frame, dtype=np.uint8, order="C", copy=True)
+    if arr.ndim != 3 or arr.shape[2] != 3:
+        raise ValueError(f"Expected an RGB frame, got array of shape {arr.shape}")
+    return arr
+
+
+def _grab_screen():
+    import pyautogui
+    return pyautogui.screenshot()
+
+
+def _encode_keyframe(frame, level: int) -> bytes:
+    return zlib.compress(frame.tobytes(), level)
+
+
+def _encode_delta(frame, tiles: List[Tuple[int, int]], tile: int, level: int) -> bytes:
+    parts = [_TILE_COUNT.pack(len(tiles))]
+    for tx, ty in tiles:
+        block = frame[ty * tile:(ty + 1) * tile, tx * tile:(tx + 1) * tile]
+        parts.append(_TILE_POS.pack(tx, ty))
+        parts.append(block.tobytes())
+    return zlib.compress(b"".join(parts), level)
+
+
+def _changed_tiles(prev, frame, tile: int) -> List[Tuple[int, int]]:
+    """Return (tile_x, tile_y) for every tile that differs between two frames."""
+    import numpy as np
+    h, w = frame.shape[:2]
+    rows, cols = -(-h // tile), -(-w // tile)
+    diff = np.any(prev != frame, axis=2)
+    pad_h, pad_w = rows * tile - h, cols * tile - w
+    if pad_h or pad_w:
+        diff = np.pad(diff, ((0, pad_h), (0, pad_w)))
+    changed = diff.reshape(rows, tile, cols, tile).any(axis=(1, 3))
+    ys, xs = np.nonzero(changed)
+    return list(zip(xs.tolist(), ys.tolist()))
+
+
+class SessionRecorder:
+    """
+    Record screen frames on a background thread into a compact append-only file.
+
+    Only tiles that changed since the previous frame are stored, with a full
+    keyframe every ``keyframe_interval`` seconds. Compression runs on a worker
+    pool and at most ``max_pending`` frames are held in memory; when the writer
+    falls behind, capture blocks instead of buffering more frames.
+    """
+    def __init__(self, path: str, fps: float = 5.0, tile_size: int = 64,
+                 keyframe_interval: float = 10.0, workers: int = 2,
+                 max_pending: int = 8, compression: int = 6,
+                 source: Optional[Callable[[], Any]] = None):
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        self.path = path
+        self.fps = fps
+        self.tile_size = tile_size
+        self.keyframe_interval = keyframe_interval
+        self.workers = workers
+        self.compression = compression
+        self.source = source or _grab_screen
+        self.frames_written = 0
+        self.frames_skipped = 0
+        self._pending: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._stop = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._capture_thread: Optional[threading.Thread] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        self._file = None
+
+    def start(self) -> 'SessionRecorder':
+        """Open the output file and start the capture and writer threads."""
+        if self._capture_thread is not None:
+            raise RuntimeError("Recorder already started")
+        self._file = open(self.path, "wb")
+        self._file.write(_FILE_HEADER.pack(MAGIC, self.tile_size))
+        self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                            thread_name_prefix="pyautoos-rec-enc")
+        self._writer_thread = threading.Thread(target=self._write_loop,
+                                               name="pyautoos-rec-writer", daemon=True)
+        self._capture_thread = threading.Thread(target=self._capture_loop,
+                                                name="pyautoos-rec-capture", daemon=True)
+        self._writer_thread.start()
+        self._capture_thread.start()
+        logger.info(f"Recording session to {self.path} at {self.fps} fps")
+        return self
+
+    def stop(self) -> None:
+        """Stop capturing, flush pending frames and close the file."""
+        if self._capture_thread is None:
+            return
+        self._stop.set()
+        self._capture_thread.join()
+        self._pending.put(None)
+        self._writer_thread.join()
+        self._executor.shutdown(wait=True)
+        self._file.close()
+        self._capture_thread = None
+        logger.info(f"Recording stopped: {self.frames_written} frames written to {self.path}")
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> 'SessionRecorder':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _capture_loop(self) -> None:
+        interval = 1.0 / self.fps
+        prev = None
+        last_key = float("-inf")
+        next_tick = time.monotonic()
+        while not self._stop.is_set() and self._error is None:
+            try:
+                ts = time.time()
+                frame = _to_array(self.source())
+                if prev is None or frame.shape != prev.shape or ts - last_key >= self.keyframe_interval:
+                    future = self._executor.submit(_encode_keyframe, frame, self.compression)
+                    kind, last_key = KEYFRAME, ts
+                else:
+                    tiles = _changed_tiles(prev, frame, self.tile_size)
+                    future = self._executor.submit(_encode_delta, frame, tiles,
+                                                   self.tile_size, self.compression)
+                    kind = DELTA
+                prev = frame
+                # Blocks once max_pending frames are queued, which keeps memory bounded.
+                self._pending.put((kind, ts, frame.shape[1], frame.shape[0], future))
+            except Exception as e:
+                logger.error(f"Failed to capture frame: {e}")
+                self._error = e
+                break
+            next_tick += interval
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                self._stop.wait(delay)
+            else:
+                missed = int(-delay // interval)
+                self.frames_skipped += missed
+                next_tick += missed * interval
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is None:
+                break
+            kind, ts, width, height, future = item
+            if self._error is not None:
+                continue
+            try:
+                payload = future.result()
+                self._file.write(_RECORD_HEADER.pack(kind, ts, width, height, len(payload)))
+                self._file.write(payload)
+                self.frames_written += 1
+            except Exception as e:
+                logger.error(f"Failed to write frame: {e}")
+                self._error = e
+
+
+class SessionReader:
+    """
+    Random-access reader for files written by SessionRecorder.
+
+    The record index is built by scanning record headers, so files from an
+    interrupted recording can still be read up to the last complete record.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        magic, self.tile_size = _FILE_HEADER.unpack(self._file.read(_FILE_HEADER.size))
+        if magic != MAGIC:
+            self._file.close()
+            raise ValueError(f"Not a pyautoos session recording: {path}")
+        self._records: List[Tuple[int, float, int, int, int, int]] = []
+        self._keyframes: List[int] = []
+        self._build_index()
+        self.timestamps: List[float] = [r[1] for r in self._records]
+        self._cursor = -1
+        self._frame = None
+
+    def _build_index(self) -> None:
+        size = os.fstat(self._file.fileno()).st_size
+        offset = _FILE_HEADER.size
+        while offset + _RECORD_HEADER.size <= size:
+            self._file.seek(offset)
+            kind, ts, width, height, length = _RECORD_HEADER.unpack(
+                self._file.read(_RECORD_HEADER.size))
+            data_offset = offset + _RECORD_HEADER.size
+            if data_offset + length > size:
+                logger.warning(f"Truncated record at offset {offset} in {self.path}")
+                break
+            if kind == KEYFRAME:
+                self._keyframes.append(len(self._records))
+            elif not self._keyframes:
+                break
+            self._records.append((kind, ts, width, height, data_offset, length))
+            offset = data_offset + length
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def duration(self) -> float:
+        """Seconds between the first and last recorded frame."""
+        if not self._records:
+            return 0.0
+        return self.timestamps[-1] - self.timestamps[0]
+
+    def _apply(self, index: int) -> None:
+        import numpy as np
+        kind, _, width, height, offset, length = self._records[index]
+        self._file.seek(offset)
+        data = zlib.decompress(self._file.read(length))
+        if kind == KEYFRAME:
+            self._frame = np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3).copy()
+        else:
+            tile = self.tile_size
+            count, = _TILE_COUNT.unpack_from(data, 0)
+            pos = _TILE_COUNT.size
+            for _ in range(count):
+                tx, ty = _TILE_POS.unpack_from(data, pos)
+                pos += _TILE_POS.size
+                x0, y0 = tx * tile, ty * tile
+                tw, th = min(tile, width - x0), min(tile, height - y0)
+                n = tw * th * 3
+                block = np.frombuffer(data, dtype=np.uint8, count=n, offset=pos)
+                self._frame[y0:y0 + th, x0:x0 + tw] = block.reshape(th, tw, 3)
+                pos += n
+        self._cursor = index
+
+    def frame(self, index: int):
+        """Return the decoded frame at a record index as an HxWx3 uint8 array."""
+        if not 0 <= index < len(self._records):
+            raise IndexError(f"Frame index {index} out of range")
+        key = self._keyframes[bisect.bisect_right(self._keyframes, index) - 1]
+        # Continue from the current frame when it lies between the keyframe and the target.
+        start = self._cursor + 1 if key <= self._cursor <= index else key
+        if self._cursor == index:
+            start = index + 1
+        for i in range(start, index + 1):
+            self._apply(i)
+        return self._frame.copy()
+
+    def frame_at(self, timestamp: float):
+        """Return the last frame recorded at or before a timestamp."""
+        index = bisect.bisect_right(self.timestamps, timestamp) - 1
+        if index < 0:
+            raise ValueError(f"No frame recorded at or before {timestamp}")
+        return self.frame(index)
+
+    def __iter__(self) -> Iterator[Tuple[float, Any]]:
+        for i in range(len(self._records)):
+            yield self.timestamps[i], self.frame(i)
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._file.close()
+
+    def __enter__(self) -> 'SessionReader':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,12 +1,44 @@
 import logging
-from typing import Optional, Tuple
+import time
+from typing import Optional, Tuple, Sequence, Union
 from pyautoos.utils import Utils
 
 logger = logging.getLogger("pyautoos.screen")
 
+Probe = Union[Tuple[int, int], Tuple[int, int, int, int]]
+
+
+def _probe_boxes(probes: Sequence[Probe]):
+    """Normalize (x, y) points and (x, y, w, h) rects to an Nx4 array of (x0, y0, x1, y1)."""
+    import numpy as np
+    boxes = np.empty((len(probes), 4), dtype=np.int64)
+    for i, p in enumerate(probes):
+        if len(p) == 2:
+            boxes[i] = (p[0], p[1], p[0] + 1, p[1] + 1)
+        elif len(p) == 4 and p[2] > 0 and p[3] > 0:
+            boxes[i] = (p[0], p[1], p[0] + p[2], p[1] + p[3])
+        else:
+            raise ValueError(f"Probe must be (x, y) or (x, y, w, h) with positive size: {p}")
+    return boxes
+
+
+def _sample_boxes(boxes, bbox, img):
+    """Color of each point and mean color of each rect, sampled from one capture of bbox."""
+    import numpy as np
+    arr = np.asarray(img.convert("RGB") if hasattr(img, "convert") else img, dtype=np.uint8)
+    x0, y0 = boxes[:, 0] - bbox[0], boxes[:, 1] - bbox[1]
+    x1, y1 = boxes[:, 2] - bbox[0], boxes[:, 3] - bbox[1]
+    colors = np.empty((len(boxes), 3), dtype=np.float64)
+    points = (x1 - x0 == 1) & (y1 - y0 == 1)
+    colors[points] = arr[y0[points], x0[points], :3]
+    for i in np.flatnonzero(~points):
+        colors[i] = arr[y0[i]:y1[i], x0[i]:x1[i], :3].mean(axis=(0, 1))
+    return colors
+
+
 class Screen:
     """
-    Screen utilities: screenshot, OCR, find image/text on screen, highlight text.
+    Screen utilities: screenshot, OCR, find image/text on screen, highlight text, pixel probes.
     """
     @staticmethod
     def screenshot(save_path: Optional[str] = None):
@@ -76,4 +108,72 @@ class Screen:
                     return True
         except Exception as e:
             logger.error(f"Failed to highlight text on screen: {e}")
-        return False 
\ No newline at end of file
+        return False 
+
+    @staticmethod
+    def _capture_probes(boxes):
+        """Capture only the bounding box of the probes and return their colors."""
+        import pyautogui
+        bbox = (int(boxes[:, 0].min()), int(boxes[:, 1].min()),
+                int(boxes[:, 2].max()), int(boxes[:, 3].max()))
+        img = pyautogui.screenshot(region=(bbox[0], bbox[1], bbox[2] - bbox[0], bbox[3] - bbox[1]))
+        return _sample_boxes(boxes, bbox, img)
+
+    @staticmethod
+    def probe(probes: Sequence[Probe]):
+        """
+        Sample many screen locations from a single capture.
+
+        Each probe is an (x, y) point or an (x, y, w, h) rect. Returns an Nx3
+        float array holding the RGB color of each point or the mean color of
+        each rect, or None on failure.
+        """
+        try:
+            colors = Screen._capture_probes(_probe_boxes(probes))
+            logger.info(f"Probed {len(probes)} screen locations.")
+            return colors
+        except Exception as e:
+            logger.error(f"Failed to probe screen: {e}")
+            return None
+
+    @staticmethod
+    def probe_matches(probes: Sequence[Probe], expected, tolerance=0):
+        """
+        Check many probes against expected RGB colors from a single capture.
+
+        tolerance is the maximum per-channel difference, either one value for
+        all probes or one per probe. Returns a boolean array, or None on failure.
+        """
+        import numpy as np
+        colors = Screen.probe(probes)
+        if colors is None:
+            return None
+        expected = np.asarray(expected, dtype=np.float64).reshape(-1, 3)
+        tolerance = np.asarray(tolerance, dtype=np.float64).reshape(-1)
+        return (np.abs(colors - expected) <= tolerance[:, None]).all(axis=1)
+
+    @staticmethod
+    def wait_for_probe_change(probes: Sequence[Probe], timeout: float = 10.0,
+                              interval: float = 0.1, tolerance=0):
+        """
+        Wait until any probe's color changes by more than tolerance.
+
+        Only the bounding box of the probes is re-captured on each poll.
+        Returns the new Nx3 color array, or None on timeout or failure.
+        """
+        import numpy as np
+        try:
+            boxes = _probe_boxes(probes)
+            tolerance = np.asarray(tolerance, dtype=np.float64).reshape(-1)[:, None]
+            baseline = Screen._capture_probes(boxes)
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                time.sleep(interval)
+                colors = Screen._capture_probes(boxes)
+                if (np.abs(colors - baseline) > tolerance).any():
+                    logger.info("Probe change detected.")
+                    return colors
+            logger.info(f"No probe change within {timeout} seconds.")
+        except Exception as e:
+            logger.error(f"Failed to wait for probe change: {e}")
+        return None
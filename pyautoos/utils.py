@@ -6,16 +6,40 @@ import sys
 import urllib.request
 import zipfile
 import subprocess
+import json
+import shutil
+import threading
 from typing import Dict, Any, Optional
 
 logger = logging.getLogger("pyautoos.utils")
 
 TESSERACT_64BIT_URL = "https://github.com/tesseract-ocr/tesseract/releases/download/5.5.0/tesseract-ocr-w64-setup-5.5.0.20241111.exe"
+TESSERACT_CANDIDATES = [
+    r"C:\Program Files\Tesseract-OCR\tesseract.exe",
+    r"C:\Program Files\tesseract.exe",
+]
+TESSERACT_RETRY_TTL = 300.0
+TESSERACT_MANIFEST_ENTRIES = 16
+
+
+def _manifest_path() -> str:
+    """Location of the persisted Tesseract toolchain manifest."""
+    if platform.system() == "Windows":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "pyautoos", "tesseract.json")
 
 class Utils:
     """
     Utility functions: platform detection, system info, logging, wait, notes, and Tesseract auto-install.
     """
+    _tesseract: Optional[Dict[str, Any]] = None
+    _tesseract_checked_at: Optional[float] = None
+    _tesseract_env: Optional[str] = None
+    _tesseract_install_attempted = False
+    _tesseract_lock = threading.Lock()
+
     @staticmethod
     def get_system_info() -> Dict[str, Any]:
         """Get basic system information."""
@@ -113,35 +137,153 @@ class Utils:
             os.environ["PATH"] = directory + os.pathsep + os.environ["PATH"]
             logger.info(f"Added {directory} to PATH.")
 
+    @staticmethod
+    def _probe_tesseract(path: str) -> Dict[str, Any]:
+        """Run the Tesseract binary once to read its version and installed languages."""
+        version = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10)
+        first = (version.stdout or version.stderr).strip().splitlines()
+        langs = subprocess.run([path, "--list-langs"], capture_output=True, text=True, timeout=10)
+        lines = (langs.stdout or langs.stderr).strip().splitlines()
+        # The header names the tessdata directory: List of available languages in "/usr/share/tessdata/" (2):
+        header = lines[0].split('"') if lines else []
+        tessdata = header[1] if len(header) >= 3 else None
+        st = os.stat(path)
+        return {
+            'path': path,
+            'version': first[0].split()[-1] if first else None,
+            'languages': [l.strip() for l in lines[1:] if l.strip()],
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'tessdata': tessdata,
+            'tessdata_mtime_ns': Utils._tessdata_mtime_ns(tessdata),
+        }
+
+    @staticmethod
+    def _tessdata_mtime_ns(tessdata: Optional[str]) -> Optional[int]:
+        """mtime of the tessdata directory, which changes when a language pack is added or removed."""
+        if tessdata is None:
+            return None
+        try:
+            return os.stat(tessdata).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _read_tesseract_manifests() -> Dict[str, Dict[str, Any]]:
+        """All persisted toolchain entries, keyed by the environment they were resolved under."""
+        try:
+            with open(_manifest_path(), 'r', encoding='utf-8') as f:
+                entries = json.load(f).get('entries', {})
+            return entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    @staticmethod
+    def _load_tesseract_manifest(env: str) -> Optional[Dict[str, Any]]:
+        """Return the persisted toolchain for env if it is still valid, else None."""
+        manifest = Utils._read_tesseract_manifests().get(env)
+        if not isinstance(manifest, dict):
+            return None
+        if manifest.get('path') is None:
+            # Cached miss: trust it until the retry TTL expires.
+            if time.time() - manifest.get('checked_at', 0) < TESSERACT_RETRY_TTL:
+                return manifest
+            return None
+        try:
+            st = os.stat(manifest['path'])
+        except OSError:
+            return None
+        if st.st_mtime_ns != manifest.get('mtime_ns') or st.st_size != manifest.get('size'):
+            return None
+        if manifest.get('tessdata') is not None and \
+                Utils._tessdata_mtime_ns(manifest['tessdata']) != manifest.get('tessdata_mtime_ns'):
+            return None
+        return manifest
+
+    @staticmethod
+    def _save_tesseract_manifest(env: str, manifest: Dict[str, Any]) -> None:
+        path = _manifest_path()
+        entries = Utils._read_tesseract_manifests()
+        entries.pop(env, None)
+        entries[env] = manifest
+        # Keep the most recently resolved environments only.
+        entries = dict(list(entries.items())[-TESSERACT_MANIFEST_ENTRIES:])
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'entries': entries}, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not save Tesseract manifest: {e}")
+
+    @staticmethod
+    def resolve_tesseract(force: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Find Tesseract once per process and point pytesseract at it.
+
+        Returns a dict with 'path', 'version' and 'languages', or None if no
+        binary was found. The result is kept in memory and in a manifest on disk
+        keyed by PATH and TESSDATA_PREFIX, so each virtualenv or conda env
+        resolves its own binary and language data. Entries are invalidated when
+        the binary's mtime or size changes, when the tessdata directory changes
+        (a language pack was added or removed), or when either variable differs.
+        A miss is cached for TESSERACT_RETRY_TTL seconds from when it was first
+        recorded. PATH is not modified.
+        """
+        with Utils._tesseract_lock:
+            search_path = os.environ.get("PATH", "")
+            env = search_path + "\0" + os.environ.get("TESSDATA_PREFIX", "")
+            now = time.time()
+            if not force and Utils._tesseract_checked_at is not None \
+                    and Utils._tesseract_env == env:
+                if Utils._tesseract is not None or now - Utils._tesseract_checked_at < TESSERACT_RETRY_TTL:
+                    return Utils._tesseract
+
+            manifest = None if force else Utils._load_tesseract_manifest(env)
+            if manifest is None:
+                found = shutil.which("tesseract", path=search_path)
+                if found is None:
+                    # Resolved at call time: install_tesseract_windows installs under the current cwd.
+                    candidates = TESSERACT_CANDIDATES + [os.path.join(os.getcwd(), "tesseract", "tesseract.exe")]
+                    found = next((p for p in candidates if os.path.isfile(p)), None)
+                try:
+                    manifest = Utils._probe_tesseract(found) if found else None
+                except (OSError, subprocess.SubprocessError) as e:
+                    logger.error(f"Failed to run Tesseract at {found}: {e}")
+                    manifest = None
+                if manifest is None:
+                    manifest = {'path': None}
+                manifest['checked_at'] = now
+                Utils._save_tesseract_manifest(env, manifest)
+
+            Utils._tesseract_env = env
+            Utils._tesseract_checked_at = manifest.get('checked_at', now)
+            if manifest.get('path') is None:
+                Utils._tesseract = None
+                logger.error("Tesseract not found.")
+                return None
+            Utils._tesseract = {k: manifest[k] for k in ('path', 'version', 'languages')}
+            try:
+                import pytesseract
+                pytesseract.pytesseract.tesseract_cmd = manifest['path']
+            except ImportError:
+                pass
+            logger.info(f"Tesseract {manifest['version']} found at {manifest['path']}.")
+            return Utils._tesseract
+
     @staticmethod
     def ensure_tesseract():
-        """Ensure Tesseract is installed and available in PATH."""
-        import shutil
-        if shutil.which("tesseract"):
-            logger.info("Tesseract is available.")
-            return True
-        # Try adding the user-provided path
-        tess_exe = r"C:\Program Files\tesseract.exe"
-        tess_dir = os.path.dirname(tess_exe)
-        if os.path.exists(tess_exe):
-            if tess_dir not in os.environ["PATH"]:
-                os.environ["PATH"] = tess_dir + os.pathsep + os.environ["PATH"]
-                logger.info(f"Added {tess_dir} to PATH.")
-            if shutil.which("tesseract"):
-                logger.info("Tesseract found after updating PATH.")
-                return True
-        # Also try adding C:\Program Files to PATH
-        if r"C:\Program Files" not in os.environ["PATH"]:
-            os.environ["PATH"] = r"C:\Program Files" + os.pathsep + os.environ["PATH"]
-            logger.info("Added C:\Program Files to PATH.")
-        if shutil.which("tesseract"):
-            logger.info("Tesseract found after adding C:\Program Files to PATH.")
+        """Ensure Tesseract is available to pytesseract, installing it on Windows if missing."""
+        if Utils.resolve_tesseract() is not None:
             return True
         if platform.system() == "Windows":
-            exe = Utils.install_tesseract_windows()
-            if exe and shutil.which("tesseract"):
-                return True
+            if not Utils._tesseract_install_attempted:
+                Utils._tesseract_install_attempted = True
+                exe = Utils.install_tesseract_windows()
+                if exe and Utils.resolve_tesseract(force=True) is not None:
+                    return True
             logger.error("Tesseract could not be installed or found after installation attempt.")
             return False
         logger.error("Tesseract auto-install is only supported on Windows.")
-        return False 
\ No newline at end of file
+        return False
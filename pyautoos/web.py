@@ -1,11 +1,246 @@
 import logging
-from typing import Optional, List
+import os
+import threading
+import time
+from fnmatch import fnmatch
+from typing import Optional, List, Dict, Iterator, Tuple
 
 logger = logging.getLogger("pyautoos.web")
 
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (_IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+               | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_ONLYDIR)
+
+
+class _InotifySource:
+    """Raw (type, path, dest_path) events from Linux inotify via ctypes."""
+    def __init__(self, path: str, recursive: bool):
+        import ctypes
+        import ctypes.util
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._root = path
+        self._recursive = recursive
+        self._dirs: Dict[int, str] = {}
+        try:
+            self._add_tree(path, required=True)
+        except OSError:
+            os.close(self._fd)
+            raise
+
+    def _add_watch(self, directory: str, required: bool = False) -> None:
+        import ctypes
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd >= 0:
+            self._dirs[wd] = directory
+        elif required:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), directory)
+
+    def _add_tree(self, directory: str, required: bool = False) -> List[str]:
+        """Watch directory (and subdirectories if recursive). Returns files found below new subdirectories."""
+        self._add_watch(directory, required)
+        found = []
+        if self._recursive:
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            found.append(entry.path)
+                            found.extend(self._add_tree(entry.path))
+                        else:
+                            found.append(entry.path)
+            except OSError:
+                pass
+        return found
+
+    def read(self, timeout: float) -> List[Tuple[str, str, Optional[str]]]:
+        import select
+        import struct
+        ready, _, _ = select.select([self._fd], [], [], max(timeout, 0))
+        if not ready:
+            return []
+        try:
+            data = os.read(self._fd, 65536)
+        except BlockingIOError:
+            return []
+        events, moves, pos = [], {}, 0
+        while pos + 16 <= len(data):
+            wd, mask, cookie, length = struct.unpack_from("iIII", data, pos)
+            name = os.fsdecode(data[pos + 16:pos + 16 + length].rstrip(b"\0"))
+            pos += 16 + length
+            if mask & _IN_Q_OVERFLOW:
+                logger.warning("inotify queue overflowed; some events were lost.")
+                events.append(("overflow", self._root, None))
+                continue
+            directory = self._dirs.get(wd)
+            if mask & _IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            if directory is None or mask & _IN_DELETE_SELF:
+                continue
+            full = os.path.join(directory, name)
+            if mask & _IN_MOVED_FROM:
+                moves[cookie] = len(events)
+                events.append(("deleted", full, None))
+            elif mask & _IN_MOVED_TO:
+                i = moves.pop(cookie, None)
+                src = None if i is None else events[i][1]
+                if src is not None:
+                    events[i] = ("moved", src, full)
+                else:
+                    events.append(("created", full, None))
+                if mask & _IN_ISDIR and self._recursive:
+                    self._rewatch_moved(src, full)
+            elif mask & _IN_CREATE:
+                events.append(("created", full, None))
+                if mask & _IN_ISDIR and self._recursive:
+                    # Files created before the new watch was added would otherwise be missed.
+                    events.extend(("created", p, None) for p in self._add_tree(full))
+            elif mask & _IN_DELETE:
+                events.append(("deleted", full, None))
+            elif mask & (_IN_MODIFY | _IN_CLOSE_WRITE) and not mask & _IN_ISDIR:
+                events.append(("modified", full, None))
+        return events
+
+    def _rewatch_moved(self, src: Optional[str], dest: str) -> None:
+        if src is not None:
+            for wd, directory in self._dirs.items():
+                if directory == src or directory.startswith(src + os.sep):
+                    self._dirs[wd] = dest + directory[len(src):]
+        else:
+            self._add_tree(dest)
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class _SnapshotSource:
+    """Raw events from diffing os.scandir snapshots of (inode, size, mtime) per path."""
+    def __init__(self, path: str, recursive: bool, poll_interval: float):
+        self._path = path
+        self._recursive = recursive
+        self._poll_interval = poll_interval
+        # Fail like inotify does when the root is missing or not a directory.
+        with os.scandir(path):
+            pass
+        self._snapshot = self._scan()
+        self._next_scan = time.monotonic() + poll_interval
+
+    def _scan(self) -> Dict[str, Tuple[int, int, int]]:
+        snapshot, stack = {}, [self._path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        try:
+                            st = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        snapshot[entry.path] = (st.st_ino, st.st_size, st.st_mtime_ns)
+                        if self._recursive and entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except OSError:
+                pass
+        return snapshot
+
+    def read(self, timeout: float) -> List[Tuple[str, str, Optional[str]]]:
+        # Short reads (e.g. the debounce window) must not trigger extra full scans.
+        wait = self._next_scan - time.monotonic()
+        if wait > timeout:
+            time.sleep(max(timeout, 0))
+            return []
+        time.sleep(max(wait, 0))
+        self._next_scan = time.monotonic() + self._poll_interval
+        old, new = self._snapshot, self._scan()
+        self._snapshot = new
+        deleted = {p: old[p] for p in old.keys() - new.keys()}
+        created = [p for p in new.keys() - old.keys()]
+        by_inode = {st[0]: p for p, st in deleted.items()}
+        events = []
+        for p in sorted(created):
+            src = by_inode.pop(new[p][0], None)
+            if src is not None:
+                del deleted[src]
+                events.append(("moved", src, p))
+            else:
+                events.append(("created", p, None))
+        events.extend(("deleted", p, None) for p in sorted(deleted))
+        events.extend(("modified", p, None) for p in sorted(old.keys() & new.keys())
+                      if old[p] != new[p] and not os.path.isdir(p))
+        return events
+
+    def close(self) -> None:
+        pass
+
+
+def _coalesce(raw: List[Tuple[str, str, Optional[str]]]) -> List[Dict]:
+    """
+    Merge a burst of raw events into at most one event per path.
+
+    Events are reported against paths the consumer already knows: a chain of
+    moves a -> b -> c becomes one move a -> c, and deleting b after a -> b is
+    reported as deleting a.
+    """
+    pending: Dict[str, Dict] = {}
+    overflow: Optional[Dict] = None
+
+    def delete(path: str) -> None:
+        prev = pending.pop(path, None)
+        if prev is not None and prev["type"] == "created":
+            return
+        origin = prev["path"] if prev is not None and prev["type"] == "moved" else path
+        if origin in pending and pending[origin]["type"] == "created":
+            # A new file already took the origin's place, so it was replaced.
+            pending[origin] = {"type": "modified", "path": origin}
+        else:
+            pending[origin] = {"type": "deleted", "path": origin}
+
+    for kind, path, dest in raw:
+        if kind == "overflow":
+            overflow = {"type": "overflow", "path": path}
+            continue
+        if kind == "deleted":
+            delete(path)
+            continue
+        prev = pending.get(path)
+        if kind == "moved":
+            pending.pop(path, None)
+            if prev is not None and prev["type"] == "created":
+                pending[dest] = {"type": "created", "path": dest}
+            elif prev is not None and prev["type"] == "moved":
+                if prev["path"] != dest:
+                    pending[dest] = {"type": "moved", "path": prev["path"], "dest_path": dest}
+            else:
+                pending[dest] = {"type": "moved", "path": path, "dest_path": dest}
+            continue
+        if prev is None:
+            pending[path] = {"type": kind, "path": path}
+        elif prev["type"] == "deleted" and kind == "created":
+            pending[path] = {"type": "modified", "path": path}
+        elif prev["type"] == "modified":
+            pending[path] = {"type": kind, "path": path}
+    events = list(pending.values())
+    return events if overflow is None else [overflow] + events
+
 class Web:
     """
-    Web and file automation utilities: search, browser, file I/O, directory listing.
+    Web and file automation utilities: search, browser, file I/O, directory listing and watching.
     """
     @staticmethod
     def search_web(query: str) -> None:
@@ -62,4 +297,136 @@ class Web:
             return items
         except Exception as e:
             logger.error(f"Failed to list directory {path}: {e}")
-            raise 
\ No newline at end of file
+            raise 
+
+    @staticmethod
+    def watch_dir(path: str, recursive: bool = False, patterns: Optional[List[str]] = None,
+                  debounce: float = 0.1, timeout: Optional[float] = None,
+                  poll_interval: float = 0.5, max_latency: float = 0.5) -> Iterator[Dict]:
+        """
+        Yield file events in a directory as dicts with 'type' ('created', 'modified',
+        'deleted' or 'moved'), 'path' and, for moves, 'dest_path'.
+
+        Uses inotify on Linux and falls back to diffing os.scandir snapshots every
+        poll_interval seconds elsewhere. Events are collected until the directory has
+        been quiet for debounce seconds, or for at most max_latency seconds while
+        something keeps changing, and merged per path, so a burst of writes to one
+        file is reported once. patterns are glob patterns matched against file
+        names. Stops after timeout seconds if given. Raises OSError if path is
+        missing or not a directory.
+
+        If the kernel event queue overflows, an {'type': 'overflow', 'path': path}
+        event is yielded (regardless of patterns); events were lost and callers
+        should resync, e.g. with list_dir.
+        """
+        return Web._watch(path, recursive, patterns, debounce, timeout, poll_interval,
+                          max_latency, None)
+
+    @staticmethod
+    def _watch(path: str, recursive: bool, patterns: Optional[List[str]], debounce: float,
+               timeout: Optional[float], poll_interval: float, max_latency: float,
+               stop: Optional[threading.Event]) -> Iterator[Dict]:
+        """Generator behind watch_dir; returns early once stop is set."""
+        try:
+            source = _InotifySource(path, recursive)
+            logger.info(f"Watching directory with inotify: {path}")
+        except OSError as e:
+            if e.filename is not None:
+                logger.error(f"Failed to watch directory {path}: {e}")
+                raise
+            source = None
+        except AttributeError:
+            # libc without inotify symbols (macOS, BSD).
+            source = None
+        if source is None:
+            try:
+                source = _SnapshotSource(path, recursive, poll_interval)
+            except OSError as e:
+                logger.error(f"Failed to watch directory {path}: {e}")
+                raise
+            logger.info(f"Watching directory by polling every {poll_interval}s: {path}")
+
+        def wanted(event: Dict) -> bool:
+            if not patterns or event["type"] == "overflow":
+                return True
+            names = [os.path.basename(event["path"])]
+            if "dest_path" in event:
+                names.append(os.path.basename(event["dest_path"]))
+            return any(fnmatch(n, pat) for n in names for pat in patterns)
+
+        def stopped() -> bool:
+            return stop is not None and stop.is_set()
+
+        # Bound each blocking read so a stop request is noticed promptly.
+        slice_ = 1.0 if stop is None else 0.1
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            while not stopped() and (deadline is None or time.monotonic() < deadline):
+                wait = slice_ if deadline is None else min(slice_, deadline - time.monotonic())
+                raw = source.read(wait)
+                if not raw:
+                    continue
+                # Keep collecting until the burst settles, but flush after max_latency
+                # so a constantly changing file cannot hold back other events.
+                flush_at = time.monotonic() + max_latency
+                if deadline is not None:
+                    flush_at = min(flush_at, deadline)
+                while not stopped():
+                    remaining = flush_at - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    more = source.read(min(debounce, remaining))
+                    if not more:
+                        break
+                    raw.extend(more)
+                for event in _coalesce(raw):
+                    if wanted(event):
+                        yield event
+        finally:
+            source.close()
+
+    @staticmethod
+    async def awatch_dir(path: str, recursive: bool = False, patterns: Optional[List[str]] = None,
+                         debounce: float = 0.1, timeout: Optional[float] = None,
+                         poll_interval: float = 0.5, max_latency: float = 0.5):
+        """
+        Async iterator version of watch_dir; takes the same arguments.
+
+        The blocking reads run on a dedicated thread that is stopped and joined
+        when the iterator finishes, is closed, or is cancelled.
+        """
+        import asyncio
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue" = asyncio.Queue()
+        stop = threading.Event()
+        done = object()
+
+        def put(item) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                pass  # Event loop already closed.
+
+        def pump() -> None:
+            try:
+                for event in Web._watch(path, recursive, patterns, debounce, timeout,
+                                        poll_interval, max_latency, stop):
+                    put(event)
+            except Exception as e:
+                put(e)
+            finally:
+                put(done)
+
+        thread = threading.Thread(target=pump, name="pyautoos-watch-dir", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            thread.join()
@@ -16,6 +16,7 @@ setup(
         "psutil",
         "opencv-python",
         "mss",
+        "numpy",
     ],
     include_package_data=True,
     classifiers=[
@@ -0,0 +1,141 @@
+import os
+import socket
+import stat
+import subprocess
+import sys
+import time
+
+import pytest
+
+from pyautoos.app import App
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX shell scripts")
+
+
+@pytest.fixture
+def launched():
+    """Collect launch results and kill whatever is still running afterwards."""
+    results = []
+    yield results
+    for r in results:
+        proc = r.get('process')
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+
+def script(tmp_path, name, body):
+    path = tmp_path / name
+    path.write_text("#!/bin/sh\n" + body + "\n")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return str(path)
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def test_probes(tmp_path, launched):
+    ready_file = tmp_path / "ready"
+    port = free_port()
+    specs = [
+        {'path': script(tmp_path, "quick.sh", f"sleep 0.2; touch {ready_file}"),
+         'ready': {'file': str(ready_file)}},
+        {'path': script(tmp_path, "server.sh", "sleep 0.2; echo listening; sleep 10"),
+         'ready': {'stdout': 'listening'}},
+        {'path': sys.executable, 'args': ['-m', 'http.server', str(port), '--bind', '127.0.0.1'],
+         'ready': {'port': port}},
+        {'path': script(tmp_path, "daemon.sh", "sleep 10"), 'ready': {'process': 0.3}},
+    ]
+    start = time.monotonic()
+    results = App.launch_many(specs, timeout=10)
+    launched.extend(results)
+    assert [r['error'] for r in results] == [None] * 4
+    assert all(r['ready'] and not r['already_running'] for r in results)
+    assert results[0]['time_to_ready'] >= 0.2
+    assert results[1]['time_to_ready'] >= 0.2
+    assert results[3]['time_to_ready'] >= 0.3
+    # Launched concurrently, not one after another.
+    assert time.monotonic() - start < 5
+
+
+def test_duplicate_specs_launch_once(tmp_path, launched):
+    path = script(tmp_path, "dup.sh", "sleep 10")
+    results = App.launch_many([path, {'path': path}], timeout=5)
+    launched.extend(results)
+    assert results[0]['pid'] == results[1]['pid']
+    assert results[0]['ready'] and results[1]['ready']
+
+
+def test_duplicate_specs_must_agree(tmp_path):
+    path = script(tmp_path, "dup.sh", "sleep 10")
+    with pytest.raises(ValueError, match="ready"):
+        App.launch_many([path, {'path': path, 'ready': {'file': str(tmp_path / "never")}}])
+    with pytest.raises(ValueError, match="timeout"):
+        App.launch_many([{'path': path, 'timeout': 1}, {'path': path, 'timeout': 2}])
+
+
+def test_already_running_is_not_relaunched(tmp_path, launched):
+    ready_file = tmp_path / "ready"
+    ready_file.touch()
+    path = script(tmp_path, "running.sh", "sleep 10")
+    proc = subprocess.Popen([path])
+    launched.append({'process': proc})
+    time.sleep(0.2)
+    results = App.launch_many([{'path': path, 'ready': {'process': 5, 'file': str(ready_file)}}],
+                              timeout=5)
+    assert results[0]['already_running']
+    assert results[0]['pid'] == proc.pid
+    assert results[0]['ready']
+
+
+def test_failures(tmp_path, launched):
+    results = App.launch_many([
+        str(tmp_path / "missing"),
+        {'path': script(tmp_path, "fail.sh", "exit 3"), 'ready': {'process': 0.3}},
+        {'path': script(tmp_path, "slow.sh", "sleep 10"), 'ready': {'file': str(tmp_path / "never")}},
+    ], timeout=0.5)
+    launched.extend(results)
+    assert not any(r['ready'] for r in results)
+    assert results[0]['pid'] is None and results[0]['error']
+    assert "exited with code 3" in results[1]['error']
+    assert "not ready" in results[2]['error']
+
+
+def test_window_probe_fails_fast_off_windows(tmp_path, launched):
+    start = time.monotonic()
+    results = App.launch_many([{'path': script(tmp_path, "w.sh", "sleep 10"),
+                                'ready': {'window': 'Anything'}}], timeout=5)
+    launched.extend(results)
+    assert results[0]['error'] == "window probe requires Windows"
+    assert results[0]['pid'] is None
+    assert time.monotonic() - start < 1
+
+
+def test_close_many_escalates_in_parallel(tmp_path):
+    polite = [subprocess.Popen(["sleep", "30"]) for _ in range(5)]
+    stubborn = [subprocess.Popen([script(tmp_path, f"hung{i}.sh", "trap '' TERM; sleep 30 & wait")])
+                for i in range(5)]
+    time.sleep(0.3)
+    start = time.monotonic()
+    reports = App.close_many([p.pid for p in polite + stubborn] + [2 ** 22 + 1], grace=1.0)
+    elapsed = time.monotonic() - start
+    for p in polite + stubborn:
+        p.wait(timeout=5)
+    outcomes = {r['pid']: r['outcome'] for r in reports}
+    assert all(outcomes[p.pid] == 'terminated' for p in polite)
+    assert all(outcomes[p.pid] == 'killed' for p in stubborn)
+    assert elapsed < 3
+
+
+def test_close_many_never_signals_caller(monkeypatch):
+    import psutil
+    target = subprocess.Popen(["sleep", "30"])
+    # Simulate matching an ancestor of this process, e.g. the launching shell.
+    monkeypatch.setattr(psutil.Process, "children",
+                        lambda self, recursive=False: [psutil.Process(os.getpid())])
+    reports = App.close_many([target.pid], grace=1.0, include_children=True)
+    target.wait(timeout=5)
+    assert [(r['pid'], r['outcome']) for r in reports] == [(target.pid, 'terminated')]
@@ -0,0 +1,117 @@
+import multiprocessing as mp
+import os
+
+import numpy as np
+import pytest
+
+from pyautoos.framebus import FrameBus, FrameBusReader
+
+WIDTH, HEIGHT = 32, 24
+
+
+def solid(value):
+    return np.full((HEIGHT, WIDTH, 3), value, dtype=np.uint8)
+
+
+@pytest.fixture
+def bus():
+    with FrameBus(WIDTH, HEIGHT, slots=4, max_consumers=2) as bus:
+        yield bus
+
+
+def read_one(name, consumer, results):
+    with FrameBusReader(name, consumer) as reader:
+        frame = reader.acquire(timeout=5)
+        results.put((frame.seq, int(frame.array[0, 0, 0]), bool(frame.array.flags.writeable)))
+        frame.release()
+
+
+def acquire_and_crash(name, consumer, results):
+    reader = FrameBusReader(name, consumer)
+    frame = reader.acquire(timeout=5)
+    results.put(frame.seq)
+    results.close()
+    results.join_thread()
+    # Exit without releasing the frame or closing the reader, like a crashed worker.
+    os._exit(0)
+
+
+def run_child(target, *args):
+    results = mp.Queue()
+    proc = mp.Process(target=target, args=args + (results,))
+    proc.start()
+    result = results.get(timeout=10)
+    proc.join(timeout=10)
+    return result
+
+
+def test_rejects_too_few_slots():
+    with pytest.raises(ValueError, match="at least 4 slots"):
+        FrameBus(WIDTH, HEIGHT, slots=3, max_consumers=2)
+
+
+def test_rejects_wrong_frame_shape(bus):
+    with pytest.raises(ValueError):
+        bus.publish(np.zeros((HEIGHT, WIDTH + 1, 3), dtype=np.uint8))
+
+
+def test_acquire_times_out_without_new_frames(bus):
+    with FrameBusReader(bus.name, 0) as reader:
+        assert reader.acquire(timeout=0.05) is None
+        seq = bus.publish(solid(1))
+        frame = reader.acquire(timeout=0.05)
+        assert frame.seq == seq
+        frame.release()
+        assert reader.acquire(after=seq, timeout=0.05) is None
+
+
+def test_views_are_read_only(bus):
+    bus.publish(solid(7))
+    with FrameBusReader(bus.name, 0) as reader, reader.acquire(timeout=1) as frame:
+        with pytest.raises(ValueError):
+            frame.array[0, 0, 0] = 1
+
+
+def test_pinned_frame_survives_many_publishes(bus):
+    bus.publish(solid(1))
+    with FrameBusReader(bus.name, 0) as reader:
+        frame = reader.acquire(timeout=1)
+        for i in range(50):
+            bus.publish(solid(100 + i))
+        assert (frame.array == 1).all()
+        with pytest.raises(RuntimeError):
+            reader.acquire(timeout=0)
+        frame.release()
+        latest = reader.acquire(timeout=1)
+        assert latest.seq == 51 and (latest.array == 149).all()
+        latest.release()
+
+
+def test_cross_process_acquire_and_release(bus):
+    seq = bus.publish(solid(42))
+    assert run_child(read_one, bus.name, 1) == (seq, 42, False)
+    assert bus._seg.pins[1] == 0
+
+
+def test_close_detaches_held_frame(bus):
+    bus.publish(solid(3))
+    reader = FrameBusReader(bus.name, 0)
+    frame = reader.acquire(timeout=1)
+    reader.close()
+    assert frame.array is None
+    assert bus._seg.pins[0] == 0
+    frame.release()
+    with pytest.raises(RuntimeError):
+        reader.acquire(timeout=0)
+
+
+def test_crashed_consumer_index_can_be_reused(bus):
+    seq = bus.publish(solid(5))
+    assert run_child(acquire_and_crash, bus.name, 0) == seq
+    assert bus._seg.pins[0] == seq
+    with FrameBusReader(bus.name, 0) as reader:
+        assert bus._seg.pins[0] == 0
+        bus.publish(solid(6))
+        frame = reader.acquire(timeout=1)
+        assert (frame.array == 6).all()
+        frame.release()
@@ -0,0 +1,98 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+from pyautoos.recorder import DELTA, KEYFRAME, SessionReader, SessionRecorder
+
+
+class SyntheticSource:
+    """Moves a square across a noisy background, reusing one output buffer like mss does."""
+    def __init__(self, shape=(90, 130, 3), resize_after=None, resized=(70, 50, 3)):
+        rng = np.random.default_rng(0)
+        self.backgrounds = {s: rng.integers(0, 256, s, dtype=np.uint8) for s in (shape, resized)}
+        self.shape = shape
+        self.resize_after = resize_after
+        self.resized = resized
+        self.buffer = None
+        self.frames = []
+
+    def __call__(self):
+        i = len(self.frames)
+        shape = self.resized if self.resize_after is not None and i >= self.resize_after else self.shape
+        if self.buffer is None or self.buffer.shape != shape:
+            self.buffer = np.empty(shape, dtype=np.uint8)
+        self.buffer[:] = self.backgrounds[shape]
+        y, x = (3 * i) % (shape[0] - 10), (5 * i) % (shape[1] - 10)
+        self.buffer[y:y + 10, x:x + 10] = i % 256
+        self.frames.append(self.buffer.copy())
+        return self.buffer
+
+
+def record(path, source, duration=0.3, **kwargs):
+    kwargs.setdefault("fps", 100)
+    kwargs.setdefault("tile_size", 16)
+    with SessionRecorder(str(path), source=source, **kwargs):
+        time.sleep(duration)
+
+
+def test_round_trip_with_keyframes_and_deltas(tmp_path):
+    path = tmp_path / "session.rec"
+    source = SyntheticSource()
+    record(path, source, keyframe_interval=0.1)
+    with SessionReader(str(path)) as reader:
+        kinds = {r[0] for r in reader._records}
+        assert kinds == {KEYFRAME, DELTA}
+        assert len(reader) == len(source.frames)
+        for expected, (_, frame) in zip(source.frames, reader):
+            np.testing.assert_array_equal(frame, expected)
+
+
+def test_shape_change_starts_new_keyframe(tmp_path):
+    path = tmp_path / "session.rec"
+    source = SyntheticSource(resize_after=5)
+    record(path, source, keyframe_interval=60)
+    with SessionReader(str(path)) as reader:
+        assert len(reader) == len(source.frames) > 5
+        assert reader._records[5][0] == KEYFRAME
+        for i in (4, 5, len(reader) - 1):
+            np.testing.assert_array_equal(reader.frame(i), source.frames[i])
+
+
+def test_random_access_and_frame_at(tmp_path):
+    path = tmp_path / "session.rec"
+    source = SyntheticSource()
+    record(path, source, keyframe_interval=0.1)
+    with SessionReader(str(path)) as reader:
+        n = len(reader)
+        for i in (n - 1, 0, n // 2, n // 2 + 1, 1, n - 2):
+            np.testing.assert_array_equal(reader.frame(i), source.frames[i])
+        ts = reader.timestamps
+        np.testing.assert_array_equal(reader.frame_at(ts[3]), source.frames[3])
+        np.testing.assert_array_equal(reader.frame_at((ts[3] + ts[4]) / 2), source.frames[3])
+        np.testing.assert_array_equal(reader.frame_at(ts[-1] + 10), source.frames[-1])
+        assert reader.duration == pytest.approx(ts[-1] - ts[0])
+        with pytest.raises(ValueError):
+            reader.frame_at(ts[0] - 1)
+        with pytest.raises(IndexError):
+            reader.frame(n)
+
+
+def test_truncated_file_keeps_complete_records(tmp_path):
+    path = tmp_path / "session.rec"
+    source = SyntheticSource()
+    record(path, source, duration=0.1)
+    size = os.path.getsize(path)
+    with open(path, "r+b") as f:
+        f.truncate(size - 3)
+    with SessionReader(str(path)) as reader:
+        assert len(reader) == len(source.frames) - 1
+        np.testing.assert_array_equal(reader.frame(len(reader) - 1), source.frames[len(reader) - 1])
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a recording")
+    with pytest.raises(ValueError):
+        SessionReader(str(path))
@@ -0,0 +1,99 @@
+import sys
+
+import numpy as np
+import pytest
+
+from pyautoos.screen import Screen, _probe_boxes, _sample_boxes
+
+
+def test_probe_boxes_normalizes_points_and_rects():
+    boxes = _probe_boxes([(5, 7), (10, 20, 3, 4)])
+    np.testing.assert_array_equal(boxes, [[5, 7, 6, 8], [10, 20, 13, 24]])
+    with pytest.raises(ValueError):
+        _probe_boxes([(1, 2, 3)])
+    with pytest.raises(ValueError):
+        _probe_boxes([(1, 2, 0, 4)])
+
+
+def test_sample_boxes_reads_points_and_rect_means():
+    frame = np.zeros((50, 80, 3), dtype=np.uint8)
+    frame[10, 20] = (255, 0, 0)
+    frame[30:32, 40:44] = (0, 100, 200)
+    frame[30:32, 44:48] = (0, 0, 0)
+    boxes = _probe_boxes([(20, 10), (40, 30, 8, 2), (79, 49)])
+    # The capture covers only the probes' bounding box, offset from the screen origin.
+    bbox = (20, 10, 80, 50)
+    colors = _sample_boxes(boxes, bbox, frame[10:50, 20:80])
+    np.testing.assert_allclose(colors, [[255, 0, 0], [0, 50, 100], [0, 0, 0]])
+
+
+class FakeScreen:
+    """Stands in for pyautogui: serves regions of a synthetic frame and records them."""
+    def __init__(self, height=1080, width=1920):
+        self.frame = np.zeros((height, width, 3), dtype=np.uint8)
+        self.regions = []
+        self.on_capture = None
+
+    def screenshot(self, region=None):
+        self.regions.append(region)
+        if self.on_capture is not None:
+            self.on_capture(len(self.regions))
+        x, y, w, h = region
+        return self.frame[y:y + h, x:x + w].copy()
+
+
+@pytest.fixture
+def screen(monkeypatch):
+    fake = FakeScreen()
+    monkeypatch.setitem(sys.modules, "pyautogui", fake)
+    return fake
+
+
+def test_probe_captures_bounding_box_once(screen):
+    screen.frame[100, 200] = (255, 0, 0)
+    screen.frame[300:310, 400:420] = (0, 200, 40)
+    colors = Screen.probe([(200, 100), (400, 300, 20, 10), (210, 120)])
+    np.testing.assert_allclose(colors, [[255, 0, 0], [0, 200, 40], [0, 0, 0]])
+    assert screen.regions == [(200, 100, 220, 210)]
+
+
+def test_probe_returns_none_for_bad_probe(screen):
+    assert Screen.probe([(1, 2, 3)]) is None
+    assert screen.regions == []
+
+
+def test_probe_matches_tolerance(screen):
+    screen.frame[10, 10] = (100, 100, 100)
+    screen.frame[20, 20] = (50, 60, 70)
+    probes = [(10, 10), (20, 20)]
+    # A single expected color is broadcast to every probe.
+    np.testing.assert_array_equal(Screen.probe_matches(probes, (104, 100, 100), tolerance=5),
+                                  [True, False])
+    # Per-probe tolerance.
+    np.testing.assert_array_equal(
+        Screen.probe_matches(probes, [(104, 100, 100), (50, 60, 72)], tolerance=[3, 2]),
+        [False, True])
+    np.testing.assert_array_equal(
+        Screen.probe_matches(probes, [(104, 100, 100), (50, 60, 72)], tolerance=[4, 1]),
+        [True, False])
+
+
+def test_wait_for_probe_change_detects_change(screen):
+    probes = [(500, 400), (520, 410, 4, 4)]
+
+    def change(n):
+        if n == 3:
+            screen.frame[400, 500] = (9, 9, 9)
+    screen.on_capture = change
+    colors = Screen.wait_for_probe_change(probes, timeout=2, interval=0.01)
+    np.testing.assert_allclose(colors, [[9, 9, 9], [0, 0, 0]])
+    assert len(screen.regions) == 3
+    assert set(screen.regions) == {(500, 400, 24, 14)}
+
+
+def test_wait_for_probe_change_respects_tolerance_and_timeout(screen):
+    def nudge(n):
+        screen.frame[50, 50] = (n % 3, 0, 0)
+    screen.on_capture = nudge
+    assert Screen.wait_for_probe_change([(50, 50)], timeout=0.1, interval=0.01, tolerance=2) is None
+    assert len(screen.regions) > 2
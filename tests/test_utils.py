@@ -0,0 +1,144 @@
+import json
+import os
+import stat
+import sys
+import time
+
+import pytest
+
+import pyautoos.utils as utils
+from pyautoos.utils import Utils
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX shell scripts")
+
+
+def fake_tesseract(directory, version):
+    """A shell script that answers --version and lists *.traineddata under its tessdata dir."""
+    directory.mkdir(parents=True, exist_ok=True)
+    tessdata = directory / "tessdata"
+    tessdata.mkdir(exist_ok=True)
+    for lang in ("eng", "osd"):
+        (tessdata / f"{lang}.traineddata").touch()
+    path = directory / "tesseract"
+    path.write_text(
+        "#!/bin/sh\n"
+        f'dir="${{TESSDATA_PREFIX:-{tessdata}}}"\n'
+        f'case "$1" in --version) echo "tesseract {version}";; '
+        '--list-langs) echo "List of available languages in \\"$dir/\\" (2):"; '
+        'for f in "$dir"/*.traineddata; do basename "$f" .traineddata; done;; esac\n')
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return str(path)
+
+
+def no_probe(path):
+    raise AssertionError("should not run tesseract again")
+
+
+@pytest.fixture
+def fresh(tmp_path, monkeypatch):
+    """Isolate the manifest and forget the in-process result, as in a new process."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.chdir(tmp_path)
+
+    def reset():
+        Utils._tesseract = None
+        Utils._tesseract_checked_at = None
+        Utils._tesseract_env = None
+
+    reset()
+    yield reset
+    reset()
+
+
+def test_resolves_once_without_touching_path(tmp_path, monkeypatch, fresh):
+    exe = fake_tesseract(tmp_path / "bin", "5.3.0")
+    monkeypatch.setenv("PATH", str(tmp_path / "bin") + os.pathsep + "/usr/bin:/bin")
+    path_before = os.environ["PATH"]
+    assert Utils.resolve_tesseract() == {'path': exe, 'version': '5.3.0', 'languages': ['eng', 'osd']}
+    assert os.environ["PATH"] == path_before
+    monkeypatch.setattr(Utils, "_probe_tesseract", staticmethod(no_probe))
+    assert Utils.resolve_tesseract()['path'] == exe
+    # A new process reuses the manifest while the binary is unchanged.
+    fresh()
+    assert Utils.resolve_tesseract()['path'] == exe
+
+
+def test_binary_change_invalidates_manifest(tmp_path, monkeypatch, fresh):
+    exe = fake_tesseract(tmp_path / "bin", "5.3.0")
+    monkeypatch.setenv("PATH", str(tmp_path / "bin") + os.pathsep + "/usr/bin:/bin")
+    Utils.resolve_tesseract()
+    fresh()
+    fake_tesseract(tmp_path / "bin", "5.4.1")
+    os.utime(exe, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+    assert Utils.resolve_tesseract()['version'] == '5.4.1'
+
+
+def test_manifest_is_keyed_by_path(tmp_path, monkeypatch, fresh):
+    first = fake_tesseract(tmp_path / "env1", "5.3.0")
+    second = fake_tesseract(tmp_path / "env2", "4.1.1")
+    monkeypatch.setenv("PATH", str(tmp_path / "env1") + os.pathsep + "/usr/bin:/bin")
+    assert Utils.resolve_tesseract()['path'] == first
+    monkeypatch.setenv("PATH", str(tmp_path / "env2") + os.pathsep + "/usr/bin:/bin")
+    assert Utils.resolve_tesseract()['path'] == second
+    fresh()
+    monkeypatch.setenv("PATH", str(tmp_path / "env1") + os.pathsep + "/usr/bin:/bin")
+    assert Utils.resolve_tesseract()['path'] == first
+
+
+def test_miss_is_cached_until_retry_ttl(tmp_path, monkeypatch, fresh):
+    monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+    assert Utils.resolve_tesseract() is None
+    exe = fake_tesseract(tmp_path / "empty", "5.3.0")
+    fresh()
+    # The cached miss is still inside its TTL, even in a new process.
+    assert Utils.resolve_tesseract() is None
+
+    manifest_file = tmp_path / "cache" / "pyautoos" / "tesseract.json"
+    data = json.loads(manifest_file.read_text())
+    for entry in data['entries'].values():
+        entry['checked_at'] -= utils.TESSERACT_RETRY_TTL - 1
+    manifest_file.write_text(json.dumps(data))
+    fresh()
+    # The TTL counts from when the miss was recorded, not from when it was loaded.
+    assert Utils.resolve_tesseract() is None
+    real_time = time.time
+    monkeypatch.setattr(utils.time, "time", lambda: real_time() + 2)
+    assert Utils.resolve_tesseract()['path'] == exe
+
+
+def test_finds_install_under_current_directory(tmp_path, monkeypatch, fresh):
+    monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+    local = tmp_path / "work"
+    (local / "tesseract").mkdir(parents=True)
+    exe = fake_tesseract(tmp_path / "real", "5.3.0")
+    os.symlink(exe, local / "tesseract" / "tesseract.exe")
+    monkeypatch.chdir(local)
+    assert Utils.resolve_tesseract()['path'] == str(local / "tesseract" / "tesseract.exe")
+
+
+def test_language_pack_change_invalidates_manifest(tmp_path, monkeypatch, fresh):
+    fake_tesseract(tmp_path / "bin", "5.3.0")
+    monkeypatch.setenv("PATH", str(tmp_path / "bin") + os.pathsep + "/usr/bin:/bin")
+    assert Utils.resolve_tesseract()['languages'] == ['eng', 'osd']
+    tessdata = tmp_path / "bin" / "tessdata"
+    (tessdata / "deu.traineddata").touch()
+    os.utime(tessdata, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+    fresh()
+    assert Utils.resolve_tesseract()['languages'] == ['deu', 'eng', 'osd']
+
+
+def test_manifest_is_keyed_by_tessdata_prefix(tmp_path, monkeypatch, fresh):
+    fake_tesseract(tmp_path / "bin", "5.3.0")
+    monkeypatch.setenv("PATH", str(tmp_path / "bin") + os.pathsep + "/usr/bin:/bin")
+    monkeypatch.delenv("TESSDATA_PREFIX", raising=False)
+    assert Utils.resolve_tesseract()['languages'] == ['eng', 'osd']
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / "fra.traineddata").touch()
+    monkeypatch.setenv("TESSDATA_PREFIX", str(other))
+    assert Utils.resolve_tesseract()['languages'] == ['fra']
+
+    monkeypatch.setattr(Utils, "_probe_tesseract", staticmethod(no_probe))
+    monkeypatch.delenv("TESSDATA_PREFIX")
+    fresh()
+    assert Utils.resolve_tesseract()['languages'] == ['eng', 'osd']
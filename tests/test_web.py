@@ -0,0 +1,155 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+import pyautoos.web as web
+from pyautoos.web import Web
+
+
+def _no_inotify(*args, **kwargs):
+    raise AttributeError("inotify unavailable")
+
+
+@pytest.fixture(params=["inotify", "snapshot"])
+def backend(request, monkeypatch):
+    if request.param == "inotify" and not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux only")
+    if request.param == "snapshot":
+        monkeypatch.setattr(web, "_InotifySource", _no_inotify)
+    return request.param
+
+
+def act_later(*steps, delay=0.3):
+    """Run filesystem steps on a thread, pausing before each one."""
+    def run():
+        for step in steps:
+            time.sleep(delay)
+            step()
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_watch_dir_reports_coalesced_events(tmp_path, backend):
+    (tmp_path / "sub").mkdir()
+    a, c, b = tmp_path / "a.txt", tmp_path / "c.txt", tmp_path / "sub" / "b.txt"
+
+    def burst():
+        for _ in range(5):
+            with open(a, "a") as f:
+                f.write("x")
+        b.write_text("y")
+        (tmp_path / "skip.log").write_text("")
+
+    # Keep the steps off the snapshot backend's scan ticks so no scan lands mid-burst.
+    thread = act_later(burst, lambda: os.rename(a, c), lambda: os.remove(b), delay=0.6)
+    events = list(Web.watch_dir(str(tmp_path), recursive=True, patterns=["*.txt"],
+                                timeout=2.5, poll_interval=0.25))
+    thread.join()
+    assert events == [
+        {"type": "created", "path": str(a)},
+        {"type": "created", "path": str(b)},
+        {"type": "moved", "path": str(a), "dest_path": str(c)},
+        {"type": "deleted", "path": str(b)},
+    ]
+
+
+def test_watch_dir_missing_directory_raises(tmp_path, backend):
+    with pytest.raises(FileNotFoundError):
+        next(Web.watch_dir(str(tmp_path / "missing"), timeout=1))
+    (tmp_path / "file").write_text("")
+    with pytest.raises(NotADirectoryError):
+        next(Web.watch_dir(str(tmp_path / "file"), timeout=1))
+
+
+def test_awatch_dir_yields_events(tmp_path, backend):
+    async def main():
+        thread = act_later(lambda: (tmp_path / "new.txt").write_text(""))
+        async for event in Web.awatch_dir(str(tmp_path), timeout=2, poll_interval=0.2):
+            thread.join()
+            return event
+
+    assert asyncio.run(main()) == {"type": "created", "path": str(tmp_path / "new.txt")}
+
+
+def test_awatch_dir_cancellation_stops_watcher(tmp_path, backend):
+    async def main():
+        events = Web.awatch_dir(str(tmp_path), poll_interval=0.2)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(events.__anext__(), 0.5)
+
+    before = {t.name for t in threading.enumerate()}
+    start = time.monotonic()
+    asyncio.run(main())
+    assert time.monotonic() - start < 2
+    assert "pyautoos-watch-dir" not in {t.name for t in threading.enumerate()} - before
+
+
+def test_busy_file_does_not_hold_back_other_events(tmp_path, backend):
+    stop = threading.Event()
+
+    def churn():
+        while not stop.is_set():
+            with open(tmp_path / "log.txt", "a") as f:
+                f.write("x")
+            time.sleep(0.01)
+
+    churner = threading.Thread(target=churn)
+    churner.start()
+    try:
+        thread = act_later(lambda: (tmp_path / "data.csv").write_text(""))
+        start = time.monotonic()
+        events = Web.watch_dir(str(tmp_path), patterns=["*.csv"], debounce=0.05,
+                               timeout=5, poll_interval=0.02, max_latency=0.3)
+        event = next(events)
+        elapsed = time.monotonic() - start
+        events.close()
+        thread.join()
+    finally:
+        stop.set()
+        churner.join()
+    assert event == {"type": "created", "path": str(tmp_path / "data.csv")}
+    assert elapsed < 1.5
+
+
+def test_watch_dir_debounce_respects_timeout(tmp_path, backend):
+    stop = threading.Event()
+
+    def churn():
+        while not stop.is_set():
+            with open(tmp_path / "log.txt", "a") as f:
+                f.write("x")
+            time.sleep(0.01)
+
+    churner = threading.Thread(target=churn)
+    churner.start()
+    try:
+        start = time.monotonic()
+        list(Web.watch_dir(str(tmp_path), patterns=["*.csv"], debounce=0.05, timeout=0.5,
+                           poll_interval=0.02, max_latency=10))
+        elapsed = time.monotonic() - start
+    finally:
+        stop.set()
+        churner.join()
+    assert elapsed < 1.5
+
+
+def test_coalesce_follows_chained_moves():
+    assert web._coalesce([("moved", "a", "b"), ("moved", "b", "c")]) == [
+        {"type": "moved", "path": "a", "dest_path": "c"}]
+    assert web._coalesce([("moved", "a", "b"), ("moved", "b", "a")]) == []
+    assert web._coalesce([("moved", "a", "b"), ("deleted", "b", None)]) == [
+        {"type": "deleted", "path": "a"}]
+    assert web._coalesce([("moved", "a", "b"), ("created", "a", None),
+                          ("deleted", "b", None)]) == [{"type": "modified", "path": "a"}]
+    assert web._coalesce([("created", "a", None), ("moved", "a", "b"),
+                          ("moved", "b", "c")]) == [{"type": "created", "path": "c"}]
+
+
+def test_overflow_is_reported_first():
+    assert web._coalesce([("created", "/w/a", None), ("overflow", "/w", None)]) == [
+        {"type": "overflow", "path": "/w"}, {"type": "created", "path": "/w/a"}]